@@ -6,21 +6,46 @@ Two-stage query processing using Groq (LLaMA 3.3 70B):
 Supports follow-up questions via conversation history.
 """
 
-import json
+import asyncio
 import logging
-from datetime import datetime
-
-from groq import Groq
-
-from config import GROQ_API_KEY, MONDAY_DEALS_BOARD_ID, MONDAY_WORKORDERS_BOARD_ID
+import threading
+import time
+from collections.abc import AsyncIterator
+from concurrent.futures import Future
+from datetime import date, datetime, timedelta
+from functools import lru_cache, partial
+from itertools import compress
+
+import orjson
+from groq import AsyncGroq
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from config import (
+    CACHE_TTL_SECONDS,
+    CONFIG,
+    MONDAY_DEALS_BOARD_ID,
+    MONDAY_WORKORDERS_BOARD_ID,
+)
 from monday_client import get_board_schema, get_all_items
-from data_cleaner import clean_board_data
+from data_cleaner import clean_board_data, parse_iso_date
+from semantic_cache import answer_cache, entity_terms, fingerprint
+from plan_router import route
 
 logger = logging.getLogger(__name__)
 
-client = Groq(api_key=GROQ_API_KEY)
 MODEL = "llama-3.3-70b-versatile"
 
+DEALS_FILTER_COLUMNS = ["Sector/service", "Deal Status", "Deal Stage", "Closure Probability", "Product deal"]
+WORKORDERS_FILTER_COLUMNS = ["Sector", "Execution Status", "Nature of Work", "Type of Work", "Billing Status"]
+
+_BOARD_LABELS = {"deals": "deals", "workorders": "work orders"}
+
+
+@lru_cache(maxsize=1)
+def get_client() -> AsyncGroq:
+    """Groq client, created on first use so importing the agent needs no API key."""
+    return AsyncGroq(api_key=CONFIG.groq_api_key)
+
 
 # ---------------------------------------------------------------------------
 # System Prompts
@@ -69,11 +94,18 @@ RULES:
 6. IMPORTANT: For sector filters, you MUST use the EXACT sector names from the AVAILABLE DATA VALUES listed above. Map user terms to the closest matching sector (e.g. "energy" maps to "Renewables" or "Powerline").
 7. For "metrics", list what calculations are needed. Options: "total_value", "count", "average_value", "list_items", "group_by", "overdue_check", "pipeline_summary".
 8. For "analysis_type": use "summary" for overview questions, "comparison" for comparing segments, "trend" for time-based analysis, "detail" for specific item lists, "risk" for stalling/overdue analysis.
-9. Today's date is {today}. Use this for any relative date calculations (e.g., "this quarter", "overdue").
-10. "This quarter" means Q1 2026: January 1 to March 31, 2026.
+9. Use TODAY'S DATE below for any relative date calculations (e.g., "this quarter", "overdue").
+"""
+
+# Appended after the prompt above. Everything before it is identical across
+# requests in a session, so the provider can reuse its cached prompt prefix.
+QUERY_DATE_CONTEXT = """
+TODAY'S DATE: {today}
+"This quarter" means {quarter}: {quarter_start} to {quarter_end}.
 """
 
 RESPONSE_GENERATION_PROMPT = """You are a sharp business analyst giving a founder a concise briefing. You work at Skylark Drones, a drone services company.
+Data keys: m=metrics, q=items queried, si=sample items, n=name, v=value, s=sector, st=status, sg=stage, ed=end date, c=count, tv=total value, av=average value, f suffix=formatted, g=by sector, p=by stage, od=overdue items, odc=overdue count, i=items.
 
 INSTRUCTIONS:
 1. Answer the question directly, like you're briefing a CEO.
@@ -94,30 +126,236 @@ TODAY'S DATE: {today}
 """
 
 
+# ---------------------------------------------------------------------------
+# Query plan schema (Stage 1 output)
+# ---------------------------------------------------------------------------
+
+class DateRange(BaseModel):
+    start: str | None = None
+    end: str | None = None
+
+
+class PlanFilters(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    sector: str | list[str] | None = None
+    status: str | list[str] | None = None
+    date_range: DateRange | None = None
+
+
+class QueryPlan(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    boards_to_query: list[str] = ["deals"]
+    filters: PlanFilters = PlanFilters()
+    metrics: list[str] = ["count", "total_value"]
+    analysis_type: str | None = None
+    explanation: str | None = None
+    needs_clarification: bool = False
+    clarification_question: str | None = None
+
+
+# ---------------------------------------------------------------------------
+# Board data cache
+# ---------------------------------------------------------------------------
+
+# Shared across requests, guarded by _CACHE_LOCK. Schemas are cached (with
+# their TTL) by monday_client; only the current object is recorded here.
+_SCHEMA_CACHE: dict[str, dict] = {}                      # {board_id: schema}
+_ITEMS_CACHE: dict[str, tuple[float, list[dict]]] = {}  # {board_id: (fetched_at, items)}
+
+# Derived values keyed by the identity of their source object. The source is
+# stored alongside the result so its id() cannot be reused while cached.
+_UNIQUE_VALUES_CACHE: dict[tuple, tuple[list[dict], dict]] = {}
+_FINGERPRINT_CACHE: dict[tuple, tuple[tuple, str]] = {}
+_CLEANED_CACHE: dict[tuple, tuple[list[dict], tuple]] = {}
+
+# {(id(cache), board_id): Future} for fetches in progress, which later callers join
+_IN_FLIGHT: dict[tuple[int, str], Future] = {}
+
+_CACHE_LOCK = threading.Lock()
+
+
+def _cached_fetch(cache: dict, board_id: str, fetch, refresh: bool = False):
+    """
+    Return a cached Monday.com result for board_id, refetching after the TTL.
+    Concurrent callers share one fetch per board, so a TTL expiry under load
+    refetches once and every waiter gets the same object.
+    """
+    key = (id(cache), board_id)
+    with _CACHE_LOCK:
+        entry = cache.get(board_id)
+        if entry and not refresh and time.monotonic() - entry[0] < CACHE_TTL_SECONDS:
+            return entry[1]
+        pending = _IN_FLIGHT.get(key)
+        if pending is None:
+            pending = _IN_FLIGHT[key] = Future()
+            owner = True
+        else:
+            owner = False
+
+    if not owner:
+        return pending.result()
+
+    fetched_at = time.monotonic()
+    try:
+        value = fetch(board_id)
+    except Exception as e:
+        with _CACHE_LOCK:
+            del _IN_FLIGHT[key]
+        pending.set_exception(e)
+        raise
+
+    with _CACHE_LOCK:
+        cache[board_id] = (fetched_at, value)
+        del _IN_FLIGHT[key]
+        _prune_derived_caches()
+    pending.set_result(value)
+    return value
+
+
+def _prune_derived_caches() -> None:
+    """Drop derived entries whose source schema/items list was replaced. Caller holds the lock."""
+    live = {id(schema) for schema in _SCHEMA_CACHE.values()}
+    live.update(id(entry[1]) for entry in _ITEMS_CACHE.values())
+    for key in [k for k in _UNIQUE_VALUES_CACHE if k[0] not in live]:
+        del _UNIQUE_VALUES_CACHE[key]
+    for key in [k for k in _FINGERPRINT_CACHE if not live.issuperset(k)]:
+        del _FINGERPRINT_CACHE[key]
+    for key in [k for k in _CLEANED_CACHE if k[0] not in live]:
+        del _CLEANED_CACHE[key]
+
+
+def _cached_schema(board_id: str, refresh: bool = False) -> dict:
+    """
+    Board schema for board_id. monday_client caches schemas itself; the
+    current object is recorded here so derived caches can track it.
+    """
+    schema = get_board_schema(board_id, refresh=refresh)
+    with _CACHE_LOCK:
+        if _SCHEMA_CACHE.get(board_id) is not schema:
+            _SCHEMA_CACHE[board_id] = schema
+            _prune_derived_caches()
+    return schema
+
+
+def _cached_board(board_id: str, refresh: bool = False) -> tuple[dict, list[dict]]:
+    """
+    Schema and raw items for board_id; items are served from memory within the
+    cache TTL. When the items are refetched, their column titles come from
+    this same schema lookup, which runs alongside the first items page, so a
+    query fetches each board's schema at most once.
+    """
+    schemas = []
+
+    def schema() -> dict:
+        schemas.append(_cached_schema(board_id, refresh))
+        return schemas[-1]
+
+    items = _cached_fetch(_ITEMS_CACHE, board_id, partial(get_all_items, schema=schema), refresh)
+    return (schemas[-1] if schemas else schema()), items
+
+
+def _data_fingerprint(*sources) -> str:
+    """Content hash of the schemas and items an answer is computed from."""
+    key = tuple(id(s) for s in sources)
+    with _CACHE_LOCK:
+        entry = _FINGERPRINT_CACHE.get(key)
+    if entry and all(a is b for a, b in zip(entry[0], sources)):
+        return entry[1]
+
+    value = fingerprint(*sources)
+    with _CACHE_LOCK:
+        _FINGERPRINT_CACHE[key] = (sources, value)
+    return value
+
+
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
 
 def _format_schema(schema: dict) -> str:
     """Format a board schema for inclusion in prompts."""
-    lines = [f"Board: {schema['board_name']}"]
+    key = (
+        schema["board_name"],
+        tuple((col["title"], col["type"], col["id"]) for col in schema["columns"]),
+    )
+    return _render_schema(key)
+
+
+@lru_cache(maxsize=8)
+def _render_schema(key: tuple) -> str:
+    board_name, columns = key
+    lines = [f"Board: {board_name}"]
     lines.append("Columns:")
-    for col in schema["columns"]:
-        lines.append(f"  - {col['title']} (type: {col['type']}, id: {col['id']})")
+    for title, col_type, col_id in columns:
+        lines.append(f"  - {title} (type: {col_type}, id: {col_id})")
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=8)
+def _format_available_values(deals_values: tuple, workorders_values: tuple) -> str:
+    """Render the AVAILABLE DATA VALUES block from (column, values) tuples."""
+    available_values = "Deals Board Available Values:\n"
+    for col, vals in deals_values:
+        available_values += f"  {col}: {', '.join(vals)}\n"
+    available_values += "\nWork Orders Board Available Values:\n"
+    for col, vals in workorders_values:
+        available_values += f"  {col}: {', '.join(vals)}\n"
+    return available_values
+
+
+@lru_cache(maxsize=8)
+def _query_prompt_template(deals_schema: str, workorders_schema: str, available_values: str) -> str:
+    """
+    The invariant Stage-1 system prompt prefix (rules, schemas, available values).
+    Cached so the exact same string is sent on every request in a session.
+    """
+    return QUERY_UNDERSTANDING_PROMPT.format(
+        deals_board_id=MONDAY_DEALS_BOARD_ID,
+        workorders_board_id=MONDAY_WORKORDERS_BOARD_ID,
+        deals_schema=deals_schema,
+        workorders_schema=workorders_schema,
+        available_values=available_values,
+    )
+
+
+def _date_context(now: datetime) -> str:
+    """The volatile Stage-1 prompt suffix: today's date and current quarter."""
+    quarter = (now.month - 1) // 3 + 1
+    start = date(now.year, 3 * quarter - 2, 1)
+    next_start = date(now.year + 1, 1, 1) if quarter == 4 else date(now.year, 3 * quarter + 1, 1)
+    end = next_start - timedelta(days=1)
+    return QUERY_DATE_CONTEXT.format(
+        today=now.strftime("%Y-%m-%d"),
+        quarter=f"Q{quarter} {now.year}",
+        quarter_start=f"{start:%B} {start.day}, {start.year}",
+        quarter_end=f"{end:%B} {end.day}, {end.year}",
+    )
+
+
 def _get_unique_values(items: list[dict], columns: list[str]) -> dict:
     """Extract unique non-null values for specified columns from raw items."""
+    key = (id(items), tuple(columns))
+    with _CACHE_LOCK:
+        entry = _UNIQUE_VALUES_CACHE.get(key)
+    if entry and entry[0] is items:
+        return entry[1]
+
+    column_dicts = [item.get("columns", {}) for item in items]
     result = {}
     for col in columns:
         values = set()
-        for item in items:
-            v = item.get("columns", {}).get(col)
+        add = values.add
+        for c in column_dicts:
+            v = c.get(col)
             if v and str(v).strip():
-                values.add(str(v).strip())
+                add(str(v).strip())
         if values:
             result[col] = sorted(values)
+
+    with _CACHE_LOCK:
+        _UNIQUE_VALUES_CACHE[key] = (items, result)
     return result
 
 
@@ -135,170 +373,371 @@ def _format_number(value: float | None) -> str:
         return f"₹{value:,.0f}"
 
 
-def _apply_filters(items: list[dict], filters: dict, board_type: str) -> list[dict]:
-    """Apply filters from the query plan to the cleaned data."""
-    filtered = items
+# Cleaned column titles backing each frame field, per board type
+_FRAME_COLUMNS = {
+    "deals": {
+        "value": "Masked Deal value",
+        "sector": "Sector/service",
+        "status": "Deal Status",
+        "stage": "Deal Stage",
+        "end_date": "Tentative Close Date",
+    },
+    "workorders": {
+        "value": "Amount in Rupees (Excl of GST) (Masked)",
+        "sector": "Sector",
+        "status": "Execution Status",
+        "stage": "Execution Status",
+        "end_date": "Probable End Date",
+    },
+}
+
+
+# Statuses that mean an item can no longer be overdue (compared lowercase)
+_CLOSED_STATUSES = frozenset({"closed", "closed won", "closed lost", "completed"})
+
+
+def _ordinal(value: date | None) -> int | None:
+    return value.toordinal() if value is not None else None
+
+
+def _to_float(value) -> float | None:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_frame(board: dict, board_type: str) -> dict[str, list]:
+    """
+    Select the fields filters and metrics use from a cleaned board (already
+    one list per column) into a frame of flat typed lists. Values are
+    converted to float and dates to day ordinals once here; match keys and
+    parsed dates are the copies the cleaner already made. "row" indexes
+    back into the cleaned board, for sample rows.
+    """
+    cols = _FRAME_COLUMNS[board_type]
+    value_col, sector_col, status_col = cols["value"], cols["sector"], cols["status"]
+    stage_col, end_col = cols["stage"], cols["end_date"]
+
+    count = len(board["ids"])
+    missing = [None] * count
+
+    def column(kind: str, title: str) -> list:
+        return board[kind].get(title, missing)
+
+    status_lc = column("columns_lc", status_col)
+    end_ord = [_ordinal(d) for d in column("dates", end_col)]
+    return {
+        "row": list(range(count)),
+        "name": board["names"],
+        "value": [_to_float(v) for v in column("columns", value_col)],
+        "sector": column("columns", sector_col),
+        "sector_lc": column("columns_lc", sector_col),
+        "status": column("columns", status_col),
+        "status_lc": status_lc,
+        "stage": column("columns", stage_col),
+        "end_date": column("columns", end_col),
+        "end_ord": end_ord,
+        # End date of rows that can still become overdue (open status), else None;
+        # the overdue check then only compares against today
+        "due_ord": [
+            d if s and s not in _CLOSED_STATUSES else None
+            for d, s in zip(end_ord, status_lc)
+        ],
+    }
+
+
+def _take(frame: dict[str, list], mask: list[bool]) -> dict[str, list]:
+    """Select the rows of a frame where mask is True."""
+    return {field: list(compress(column, mask)) for field, column in frame.items()}
+
+
+def _match_mask(column_lc: list[str | None], wanted) -> list[bool]:
+    """
+    Match a lowercased column against the wanted term(s): a row matches when
+    any term is a case-insensitive substring of its value, e.g. "closed" for
+    "Closed Won". Columns repeat a few distinct values, so each distinct value
+    is tested once and rows become a set lookup.
+    """
+    terms = tuple({str(s).lower() for s in (wanted if isinstance(wanted, list) else [wanted]) if s is not None})
+    matching = frozenset(v for v in set(column_lc) if v and any(t in v for t in terms))
+    return [v in matching for v in column_lc]
+
+
+def _apply_filters(frame: dict[str, list], filters: dict) -> dict[str, list]:
+    """Apply filters from the query plan to a board frame."""
+    mask = [True] * len(frame["row"])
 
     sector = filters.get("sector")
     if sector:
-        # Handle both string and list values
-        if isinstance(sector, list):
-            sector_list = [s.lower() for s in sector]
-        else:
-            sector_list = [sector.lower()]
-        sector_col = "Sector/service" if board_type == "deals" else "Sector"
-        filtered = [
-            item for item in filtered
-            if item["columns"].get(sector_col)
-            and any(s in str(item["columns"][sector_col]).lower() for s in sector_list)
-        ]
+        mask = [m and hit for m, hit in zip(mask, _match_mask(frame["sector_lc"], sector))]
 
     status = filters.get("status")
     if status:
-        if isinstance(status, list):
-            status_list = [s.lower() for s in status]
-        else:
-            status_list = [status.lower()]
-        status_col = "Deal Status" if board_type == "deals" else "Execution Status"
-        filtered = [
-            item for item in filtered
-            if item["columns"].get(status_col)
-            and any(s in str(item["columns"][status_col]).lower() for s in status_list)
-        ]
+        mask = [m and hit for m, hit in zip(mask, _match_mask(frame["status_lc"], status))]
 
     date_range = filters.get("date_range", {})
     start_date = date_range.get("start") if date_range else None
     end_date = date_range.get("end") if date_range else None
 
     if start_date or end_date:
-        date_col = "Tentative Close Date" if board_type == "deals" else "Probable End Date"
-        date_filtered = []
-        for item in filtered:
-            item_date = item["columns"].get(date_col)
-            if not item_date:
-                continue
-            try:
-                d = datetime.strptime(item_date, "%Y-%m-%d")
-                if start_date and d < datetime.strptime(start_date, "%Y-%m-%d"):
-                    continue
-                if end_date and d > datetime.strptime(end_date, "%Y-%m-%d"):
-                    continue
-                date_filtered.append(item)
-            except ValueError:
-                continue
-        filtered = date_filtered
-
-    return filtered
-
-
-def _compute_metrics(items: list[dict], metrics: list[str], board_type: str) -> dict:
-    """Compute requested metrics on filtered data."""
-    results = {}
+        start = parse_iso_date(start_date)
+        end = parse_iso_date(end_date)
+        if (start_date and start is None) or (end_date and end is None):
+            # An unparseable bound matches nothing
+            mask = [False] * len(mask)
+        else:
+            # Compare day ordinals; a missing bound is open-ended
+            lo = start.toordinal() if start else float("-inf")
+            hi = end.toordinal() if end else float("inf")
+            mask = [
+                m and d is not None and lo <= d <= hi
+                for m, d in zip(mask, frame["end_ord"])
+            ]
+
+    return _take(frame, mask)
+
+
+def _add_to_group(groups: dict, key, value: float | None) -> None:
+    """Count a row and add its value under key, in first-seen key order."""
+    key = key or "Unknown"
+    group = groups.get(key)
+    if group is None:
+        group = groups[key] = {"count": 0, "total_value": 0}
+    group["count"] += 1
+    if value is not None:
+        group["total_value"] += value
+
+
+def _format_groups(groups: dict) -> dict:
+    for g in groups.values():
+        g["total_value_formatted"] = _format_number(g["total_value"])
+    return groups
+
+
+def _drop_none(row: dict) -> dict:
+    return {k: v for k, v in row.items() if v is not None}
+
+
+def _summarize(board: dict, row: int) -> dict:
+    """Name plus the non-empty columns of one cleaned board row, for sample rows."""
+    return {
+        "name": board["names"][row],
+        **{title: cells[row] for title, cells in board["columns"].items() if cells[row] is not None},
+    }
+
 
-    value_col = "Masked Deal value" if board_type == "deals" else "Amount in Rupees (Excl of GST) (Masked)"
+def _compute_metrics(frame: dict[str, list], metrics: list[str], today_ord: int, list_stage: bool = True) -> dict:
+    """
+    Compute requested metrics on a filtered board frame.
+    All metrics are accumulated in a single pass over the rows; today_ord is
+    the request's date as a day ordinal, shared by every board. list_stage is
+    False for boards whose stage column is their status column, so listed
+    items do not repeat it.
+    """
+    wanted = set(metrics)
+    want_groups = "group_by" in wanted
+    want_pipeline = "pipeline_summary" in wanted
+    want_overdue = "overdue_check" in wanted
+    want_list = "list_items" in wanted
+
+    total, valued = 0, 0
+    groups, pipeline = {}, {}
+    overdue_items, item_rows = [], []
+
+    rows = zip(
+        frame["name"], frame["value"], frame["sector"], frame["status"],
+        frame["stage"], frame["end_date"], frame["due_ord"],
+    )
+    for name, value, sector, status, stage, end_date, due_ord in rows:
+        if value is not None:
+            total += value
+            valued += 1
+
+        if want_groups:
+            _add_to_group(groups, sector, value)
+        if want_pipeline:
+            _add_to_group(pipeline, stage, value)
+
+        # Due dates carry no time, so anything due today or earlier is overdue
+        if want_overdue and due_ord is not None and due_ord <= today_ord:
+            overdue_items.append({
+                "name": name,
+                "end_date": end_date,
+                "status": status,
+                "value": _format_number(value or 0),
+            })
+
+        # Only the fields the briefing refers to, not every board column
+        if want_list and len(item_rows) < 50:
+            item_rows.append(_drop_none({
+                "name": name,
+                "value": value,
+                "sector": sector,
+                "status": status,
+                "stage": stage if list_stage else None,
+                "end_date": end_date,
+            }))
 
-    values = []
-    for item in items:
-        v = item["columns"].get(value_col)
-        if v is not None:
-            try:
-                values.append(float(v))
-            except (ValueError, TypeError):
-                pass
+    results = {}
 
-    if "total_value" in metrics:
-        results["total_value"] = sum(values) if values else 0
-        results["total_value_formatted"] = _format_number(results["total_value"])
+    if "total_value" in wanted:
+        results["total_value"] = total
+        results["total_value_formatted"] = _format_number(total)
 
-    if "count" in metrics:
-        results["count"] = len(items)
+    if "count" in wanted:
+        results["count"] = len(frame["row"])
 
-    if "average_value" in metrics:
-        results["average_value"] = sum(values) / len(values) if values else 0
+    if "average_value" in wanted:
+        results["average_value"] = total / valued if valued else 0
         results["average_value_formatted"] = _format_number(results["average_value"])
 
-    if "group_by" in metrics:
-        groups = {}
-        sector_col = "Sector/service" if board_type == "deals" else "Sector"
-        for item in items:
-            key = item["columns"].get(sector_col) or "Unknown"
-            if key not in groups:
-                groups[key] = {"count": 0, "total_value": 0}
-            groups[key]["count"] += 1
-            v = item["columns"].get(value_col)
-            if v is not None:
-                try:
-                    groups[key]["total_value"] += float(v)
-                except (ValueError, TypeError):
-                    pass
-        for k, v in groups.items():
-            v["total_value_formatted"] = _format_number(v["total_value"])
-        results["groups"] = groups
-
-    if "pipeline_summary" in metrics:
-        stage_col = "Deal Stage" if board_type == "deals" else "Execution Status"
-        stages = {}
-        for item in items:
-            stage = item["columns"].get(stage_col) or "Unknown"
-            if stage not in stages:
-                stages[stage] = {"count": 0, "total_value": 0}
-            stages[stage]["count"] += 1
-            v = item["columns"].get(value_col)
-            if v is not None:
-                try:
-                    stages[stage]["total_value"] += float(v)
-                except (ValueError, TypeError):
-                    pass
-        for k, v in stages.items():
-            v["total_value_formatted"] = _format_number(v["total_value"])
-        results["pipeline"] = stages
-
-    if "overdue_check" in metrics:
-        today = datetime.now()
-        overdue_items = []
-        end_col = "Tentative Close Date" if board_type == "deals" else "Probable End Date"
-        status_col = "Deal Status" if board_type == "deals" else "Execution Status"
-        for item in items:
-            end_date = item["columns"].get(end_col)
-            status = item["columns"].get(status_col, "")
-            if end_date:
-                try:
-                    d = datetime.strptime(end_date, "%Y-%m-%d")
-                    if d < today and status and status.lower() not in ["closed", "closed won", "closed lost", "completed"]:
-                        overdue_items.append({
-                            "name": item["name"],
-                            "end_date": end_date,
-                            "status": status,
-                            "value": _format_number(
-                                float(item["columns"].get(value_col, 0) or 0)
-                            ),
-                        })
-                except (ValueError, TypeError):
-                    pass
+    if want_groups:
+        results["groups"] = _format_groups(groups)
+
+    if want_pipeline:
+        results["pipeline"] = _format_groups(pipeline)
+
+    if want_overdue:
         results["overdue_items"] = overdue_items
         results["overdue_count"] = len(overdue_items)
 
-    if "list_items" in metrics:
-        item_summaries = []
-        for item in items[:50]:
-            summary = {"name": item["name"]}
-            for col, val in item["columns"].items():
-                if val is not None:
-                    summary[col] = val
-            item_summaries.append(summary)
-        results["items"] = item_summaries
+    if want_list:
+        results["items"] = item_rows
 
     return results
 
 
-def _call_groq(system_prompt: str, messages: list[dict], max_tokens: int = 1024) -> str:
-    """Make a call to Groq API and return the response text."""
-    groq_messages = [{"role": "system", "content": system_prompt}]
-    groq_messages.extend(messages)
+def _extract_json(text: str) -> str:
+    """Slice the JSON object out of an LLM reply (drops code fences or stray prose)."""
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end < start:
+        return text
+    return text[start:end + 1]
+
+
+def _parse_query_plan(plan_text: str) -> dict:
+    """
+    Parse and validate the Stage-1 plan in one pass.
+    A plan that is valid JSON but off-schema is accepted leniently as-is;
+    invalid JSON raises orjson.JSONDecodeError.
+    """
+    payload = _extract_json(plan_text)
+    try:
+        return QueryPlan.model_validate_json(payload).model_dump(exclude_unset=True)
+    except ValidationError as e:
+        query_plan = orjson.loads(payload)
+        logger.warning(f"Query plan failed validation, using it unvalidated: {e.error_count()} error(s)")
+        return query_plan
+
+
+# Short keys for the Stage-2 payload, spelled out in RESPONSE_GENERATION_PROMPT
+_TERSE_KEYS = {
+    "metrics": "m",
+    "total_items_queried": "q",
+    "sample_items": "si",
+    "name": "n",
+    "value": "v",
+    "sector": "s",
+    "status": "st",
+    "stage": "sg",
+    "end_date": "ed",
+    "count": "c",
+    "total_value": "tv",
+    "total_value_formatted": "tvf",
+    "average_value": "av",
+    "average_value_formatted": "avf",
+    "groups": "g",
+    "pipeline": "p",
+    "overdue_items": "od",
+    "overdue_count": "odc",
+    "items": "i",
+}
+
+# Metrics whose keys are data values (sector or stage names), not field names
+_KEYED_BY_VALUE = frozenset({"groups", "pipeline"})
+
+# Analysis types answered from the metrics alone, without sample rows
+_METRICS_ONLY_ANALYSES = frozenset({"summary", "comparison"})
+
+
+def _terse(obj, rename: bool = True):
+    """Shorten known keys, drop nulls and round floats to 2 decimals before serializing."""
+    if isinstance(obj, dict):
+        return {
+            (_TERSE_KEYS.get(k, k) if rename else k): _terse(v, k not in _KEYED_BY_VALUE)
+            for k, v in obj.items()
+            if v is not None
+        }
+    if isinstance(obj, list):
+        return [_terse(v) for v in obj]
+    if isinstance(obj, float):
+        return round(obj, 2)
+    return obj
 
-    response = client.chat.completions.create(
+
+def _to_json(obj) -> str:
+    """Serialize prompt data with orjson (compact, non-string keys allowed)."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str).decode()
+
+
+def _cleaned_board(board_type: str, raw_items: list[dict]) -> tuple[dict, dict[str, list]]:
+    """
+    Clean a fetched items list and select its frame, once per fetch.
+    Returns (cleaned board, frame).
+    The result is shared read-only by every request served from the same items.
+    """
+    key = (id(raw_items), board_type)
+    with _CACHE_LOCK:
+        entry = _CLEANED_CACHE.get(key)
+    if entry and entry[0] is raw_items:
+        return entry[1]
+
+    board = clean_board_data(raw_items)
+    result = (board, _to_frame(board, board_type))
+    with _CACHE_LOCK:
+        _CLEANED_CACHE[key] = (raw_items, result)
+    return result
+
+
+def _process_board(board_type: str, raw_items: list[dict], filters: dict, metrics: list[str], today_ord: int) -> tuple[list[str], dict]:
+    """
+    Clean, filter and compute metrics for one board.
+    Runs in a worker thread, so trace lines are returned rather than appended.
+    """
+    label = _BOARD_LABELS[board_type]
+    trace = [
+        f"Processing {label} data...",
+        f"Using {len(raw_items)} {label} from Monday.com",
+        f"Cleaning and normalizing {label} data...",
+    ]
+
+    board, frame = _cleaned_board(board_type, raw_items)
+    frame = _apply_filters(frame, filters)
+    trace.append(f"After filtering: {len(frame['row'])} {label} match criteria")
+
+    cols = _FRAME_COLUMNS[board_type]
+    computed = _compute_metrics(frame, metrics, today_ord, list_stage=cols["stage"] != cols["status"])
+    return trace, {
+        "board": board,
+        "rows": frame["row"],
+        "metrics": computed,
+        "quality": board["quality"],
+    }
+
+
+async def _call_groq(system_prompt: str, history: tuple[dict, ...], user_message: str, max_tokens: int = 1024) -> str:
+    """Make a call to Groq API and return the response text."""
+    response = await get_client().chat.completions.create(
         model=MODEL,
-        messages=groq_messages,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            *history,
+            {"role": "user", "content": user_message},
+        ],
         max_tokens=max_tokens,
         temperature=0.1,
     )
@@ -306,30 +745,31 @@ def _call_groq(system_prompt: str, messages: list[dict], max_tokens: int = 1024)
     return response.choices[0].message.content.strip()
 
 
-# ---------------------------------------------------------------------------
-# Core agent function
-# ---------------------------------------------------------------------------
+async def _call_groq_stream(system_prompt: str, history: tuple[dict, ...], user_message: str, max_tokens: int = 1024) -> AsyncIterator[str]:
+    """Make a streaming call to Groq API, yielding response text as it is generated."""
+    stream = await get_client().chat.completions.create(
+        model=MODEL,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            *history,
+            {"role": "user", "content": user_message},
+        ],
+        max_tokens=max_tokens,
+        temperature=0.1,
+        stream=True,
+    )
 
-def process_query(message: str, history: list[dict] = None) -> dict:
-    """
-    Process a user's business intelligence query.
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
 
-    Args:
-        message: The user's question
-        history: Conversation history list of {"role": str, "content": str}
 
-    Returns:
-        {
-            "answer": str,
-            "action_trace": [str, ...],
-            "data_quality_report": dict
-        }
-    """
-    if history is None:
-        history = []
+# ---------------------------------------------------------------------------
+# Core agent function
+# ---------------------------------------------------------------------------
 
-    action_trace = []
-    combined_quality_report = {
+def _new_quality_report() -> dict:
+    return {
         "total_items": 0,
         "missing_values": 0,
         "unparseable_dates": 0,
@@ -338,178 +778,198 @@ def process_query(message: str, history: list[dict] = None) -> dict:
         "issues": [],
     }
 
-    try:
-        # ----- Step 1: Fetch board schemas -----
-        action_trace.append("Fetching board schemas from Monday.com...")
-        deals_schema = get_board_schema(MONDAY_DEALS_BOARD_ID)
-        workorders_schema = get_board_schema(MONDAY_WORKORDERS_BOARD_ID)
-        action_trace.append(f"Retrieved schemas: Deals ({len(deals_schema['columns'])} columns), Work Orders ({len(workorders_schema['columns'])} columns)")
-
-        # Fetch a quick sample to get unique values for key columns
-        action_trace.append("Fetching available filter values...")
-        deals_items_raw = get_all_items(MONDAY_DEALS_BOARD_ID)
-        deals_unique = _get_unique_values(deals_items_raw, ["Sector/service", "Deal Status", "Deal Stage", "Closure Probability", "Product deal"])
-        wo_items_raw = get_all_items(MONDAY_WORKORDERS_BOARD_ID)
-        wo_unique = _get_unique_values(wo_items_raw, ["Sector", "Execution Status", "Nature of Work", "Type of Work", "Billing Status"])
-
-        available_values = "Deals Board Available Values:\n"
-        for col, vals in deals_unique.items():
-            available_values += f"  {col}: {', '.join(vals)}\n"
-        available_values += "\nWork Orders Board Available Values:\n"
-        for col, vals in wo_unique.items():
-            available_values += f"  {col}: {', '.join(vals)}\n"
-
-        # ----- Step 2: Query Understanding (LLM Stage 1) -----
-        action_trace.append("Analyzing query with AI to create execution plan...")
 
-        today = datetime.now().strftime("%Y-%m-%d")
-        system_prompt = QUERY_UNDERSTANDING_PROMPT.format(
-            deals_board_id=MONDAY_DEALS_BOARD_ID,
-            workorders_board_id=MONDAY_WORKORDERS_BOARD_ID,
-            deals_schema=_format_schema(deals_schema),
-            workorders_schema=_format_schema(workorders_schema),
-            available_values=available_values,
-            today=today,
-        )
+async def _prepare_response(
+    message: str,
+    history: list[dict],
+    refresh: bool,
+    action_trace: list[str],
+    combined_quality_report: dict,
+) -> dict:
+    """
+    Run every step up to the Stage-2 LLM call.
 
-        # Build messages including history for context
-        messages = []
-        for h in history[-10:]:
-            messages.append({"role": h["role"], "content": h["content"]})
-        messages.append({"role": "user", "content": message})
+    Returns {"result": response} when the query is answered early (cached
+    answer or clarifying question). Otherwise returns the Stage-2 "system"
+    prompt, trimmed "history" and user "message", plus what _finish_response needs.
+    """
+    # ----- Step 1: Fetch board schemas and items (concurrently) -----
+    action_trace.append("Fetching board schemas and items from Monday.com...")
+    (deals_schema, deals_items_raw), (workorders_schema, wo_items_raw) = await asyncio.gather(
+        asyncio.to_thread(_cached_board, MONDAY_DEALS_BOARD_ID, refresh),
+        asyncio.to_thread(_cached_board, MONDAY_WORKORDERS_BOARD_ID, refresh),
+    )
+    action_trace.append(f"Retrieved schemas: Deals ({len(deals_schema['columns'])} columns), Work Orders ({len(workorders_schema['columns'])} columns)")
+
+    # Unique values for key columns give the planner the exact filter vocabulary.
+    # The answer cache's data fingerprint serializes every item, so it is
+    # hashed in a worker thread too rather than on the event loop
+    action_trace.append("Extracting available filter values...")
+    deals_unique, wo_unique, data_fp = await asyncio.gather(
+        asyncio.to_thread(_get_unique_values, deals_items_raw, DEALS_FILTER_COLUMNS),
+        asyncio.to_thread(_get_unique_values, wo_items_raw, WORKORDERS_FILTER_COLUMNS),
+        asyncio.to_thread(_data_fingerprint, deals_schema, workorders_schema, deals_items_raw, wo_items_raw),
+    )
 
-        plan_text = _call_groq(system_prompt, messages, max_tokens=1024)
+    available_values = _format_available_values(
+        tuple((col, tuple(vals)) for col, vals in deals_unique.items()),
+        tuple((col, tuple(vals)) for col, vals in wo_unique.items()),
+    )
+
+    # Conversation context sent with both LLM calls, built once
+    trimmed = tuple({"role": h["role"], "content": h["content"]} for h in history[-10:])
+
+    # One clock reading per query, shared by the answer cache, the prompts and
+    # every board's metrics
+    now = datetime.now()
+    today = now.strftime("%Y-%m-%d")
+    today_ord = now.toordinal()
+
+    # Reuse the answer to a near-duplicate question asked against the same data
+    # at the same point in a conversation on the same day (overdue checks and
+    # relative date ranges depend on today's date)
+    context = f"{today}:{fingerprint(trimmed)}" if trimmed else today
+    terms = entity_terms({**deals_unique, **wo_unique})
+    if not refresh:
+        cached = answer_cache.lookup(message, data_fp, terms, context)
+        if cached:
+            action_trace.append("Found an answer to a matching question on unchanged data, skipping AI analysis")
+            return {"result": {
+                "answer": cached["answer"],
+                "action_trace": action_trace,
+                "data_quality_report": cached["data_quality_report"],
+            }}
+
+    # ----- Step 2: Query Understanding (LLM Stage 1) -----
+    # Standard standalone questions have a built-in plan; follow-ups always
+    # go to the LLM since they depend on the conversation
+    routed = None if trimmed else route(message)
+    if routed:
+        route_name, query_plan = routed
+        logger.info(f"Query plan from router ({route_name}): {message[:100]}")
+        action_trace.append("Recognized a standard question, using a built-in query plan...")
+    else:
+        logger.info(f"Query plan from LLM: {message[:100]}")
+        action_trace.append("Analyzing query with AI to create execution plan...")
 
-        # Try to parse JSON from the response (handle markdown code fences)
-        if plan_text.startswith("```"):
-            plan_text = plan_text.split("```")[1]
-            if plan_text.startswith("json"):
-                plan_text = plan_text[4:]
-            plan_text = plan_text.strip()
+        system_prompt = _query_prompt_template(
+            _format_schema(deals_schema),
+            _format_schema(workorders_schema),
+            available_values,
+        ) + _date_context(now)
+
+        # Clean both boards while the plan is generated; the result is memoized
+        # per fetch, so Step 3 only filters and aggregates
+        plan_text, _, _ = await asyncio.gather(
+            _call_groq(system_prompt, trimmed, message, max_tokens=1024),
+            asyncio.to_thread(_cleaned_board, "deals", deals_items_raw),
+            asyncio.to_thread(_cleaned_board, "workorders", wo_items_raw),
+        )
 
-        try:
-            query_plan = json.loads(plan_text)
-        except json.JSONDecodeError:
-            json_match = plan_text[plan_text.find("{"):plan_text.rfind("}") + 1]
-            query_plan = json.loads(json_match)
+        query_plan = _parse_query_plan(plan_text)
 
         # Check if the LLM needs clarification
         if query_plan.get("needs_clarification"):
             clarification = query_plan.get("clarification_question", "Could you be more specific about what you'd like to know?")
             action_trace.append(f"Need more info: {clarification}")
-            return {
+            return {"result": {
                 "answer": clarification,
                 "action_trace": action_trace,
                 "data_quality_report": combined_quality_report,
-            }
-
-        action_trace.append(f"Query plan: query {', '.join(query_plan.get('boards_to_query', []))} board(s), analysis type: {query_plan.get('analysis_type', 'unknown')}")
-
-        # ----- Step 3: Fetch and clean data -----
-        all_data = {}
-        boards_to_query = query_plan.get("boards_to_query", ["deals"])
-        filters = query_plan.get("filters", {})
-        metrics = query_plan.get("metrics", ["count", "total_value"])
-
-        for board in boards_to_query:
-            if board == "deals":
-                action_trace.append("Processing deals data...")
-                raw_items = deals_items_raw  # Already fetched above
-                action_trace.append(f"Using {len(raw_items)} deals from Monday.com")
-
-                action_trace.append("Cleaning and normalizing deals data...")
-                cleaned_items, quality_report = clean_board_data(raw_items)
-                combined_quality_report["total_items"] += quality_report["total_items"]
-                combined_quality_report["missing_values"] += quality_report["missing_values"]
-                combined_quality_report["unparseable_dates"] += quality_report["unparseable_dates"]
-                combined_quality_report["unparseable_numbers"] += quality_report["unparseable_numbers"]
-                combined_quality_report["issues"].extend(quality_report.get("issues", []))
-
-                filtered_items = _apply_filters(cleaned_items, filters, "deals")
-                action_trace.append(f"After filtering: {len(filtered_items)} deals match criteria")
-
-                computed = _compute_metrics(filtered_items, metrics, "deals")
-                all_data["deals"] = {
-                    "items": filtered_items,
-                    "metrics": computed,
-                    "quality": quality_report,
-                }
-
-            elif board == "workorders":
-                action_trace.append("Processing work orders data...")
-                raw_items = wo_items_raw  # Already fetched above
-                action_trace.append(f"Using {len(raw_items)} work orders from Monday.com")
-
-                action_trace.append("Cleaning and normalizing work order data...")
-                cleaned_items, quality_report = clean_board_data(raw_items)
-                combined_quality_report["total_items"] += quality_report["total_items"]
-                combined_quality_report["missing_values"] += quality_report["missing_values"]
-                combined_quality_report["unparseable_dates"] += quality_report["unparseable_dates"]
-                combined_quality_report["unparseable_numbers"] += quality_report["unparseable_numbers"]
-                combined_quality_report["issues"].extend(quality_report.get("issues", []))
-
-                filtered_items = _apply_filters(cleaned_items, filters, "workorders")
-                action_trace.append(f"After filtering: {len(filtered_items)} work orders match criteria")
-
-                computed = _compute_metrics(filtered_items, metrics, "workorders")
-                all_data["workorders"] = {
-                    "items": filtered_items,
-                    "metrics": computed,
-                    "quality": quality_report,
-                }
-
-        # Update combined summary
-        combined_quality_report["summary"] = (
-            f"{combined_quality_report['missing_values']} missing values, "
-            f"{combined_quality_report['unparseable_dates']} unparseable dates, "
-            f"{combined_quality_report['unparseable_numbers']} unparseable numbers "
-            f"across {combined_quality_report['total_items']} total items."
-        )
+            }}
+
+    action_trace.append(f"Query plan: query {', '.join(query_plan.get('boards_to_query', []))} board(s), analysis type: {query_plan.get('analysis_type', 'unknown')}")
+
+    # ----- Step 3: Fetch and clean data -----
+    all_data = {}
+    boards_to_query = query_plan.get("boards_to_query", ["deals"])
+    filters = query_plan.get("filters", {})
+    metrics = query_plan.get("metrics", ["count", "total_value"])
+
+    raw_items_by_board = {"deals": deals_items_raw, "workorders": wo_items_raw}
+    boards = [board for board in boards_to_query if board in raw_items_by_board]
+    results = await asyncio.gather(*(
+        asyncio.to_thread(_process_board, board, raw_items_by_board[board], filters, metrics, today_ord)
+        for board in boards
+    ))
+
+    for board, (board_trace, board_data) in zip(boards, results):
+        action_trace.extend(board_trace)
+
+        quality_report = board_data["quality"]
+        combined_quality_report["total_items"] += quality_report["total_items"]
+        combined_quality_report["missing_values"] += quality_report["missing_values"]
+        combined_quality_report["unparseable_dates"] += quality_report["unparseable_dates"]
+        combined_quality_report["unparseable_numbers"] += quality_report["unparseable_numbers"]
+        combined_quality_report["issues"].extend(quality_report.get("issues", []))
+        all_data[board] = board_data
+
+    # Update combined summary
+    combined_quality_report["summary"] = (
+        f"{combined_quality_report['missing_values']} missing values, "
+        f"{combined_quality_report['unparseable_dates']} unparseable dates, "
+        f"{combined_quality_report['unparseable_numbers']} unparseable numbers "
+        f"across {combined_quality_report['total_items']} total items."
+    )
 
-        # ----- Step 4: Response Generation (LLM Stage 2) -----
-        action_trace.append("Generating business insight response...")
-
-        data_summary = {}
-        for board_name, board_data in all_data.items():
-            data_summary[board_name] = {
-                "metrics": board_data["metrics"],
-                "total_items_queried": len(board_data["items"]),
-                "sample_items": [
-                    {"name": item["name"], **{k: v for k, v in item["columns"].items() if v is not None}}
-                    for item in board_data["items"][:15]
-                ],
-            }
-
-        response_system = RESPONSE_GENERATION_PROMPT.format(
-            quality_notes=combined_quality_report["summary"],
-            today=today,
-        )
+    # ----- Step 4: Response Generation (LLM Stage 2) -----
+    action_trace.append("Generating business insight response...")
+
+    with_samples = query_plan.get("analysis_type") not in _METRICS_ONLY_ANALYSES
+    data_summary = {}
+    for board_name, board_data in all_data.items():
+        data_summary[board_name] = {
+            "metrics": board_data["metrics"],
+            "total_items_queried": len(board_data["rows"]),
+        }
+        if with_samples:
+            cleaned = board_data["board"]
+            data_summary[board_name]["sample_items"] = [_summarize(cleaned, row) for row in board_data["rows"][:15]]
+
+    response_system = (
+        RESPONSE_GENERATION_PROMPT
+        .replace("{quality_notes}", combined_quality_report["summary"])
+        .replace("{today}", today)
+    )
 
-        response_messages = []
-        for h in history[-10:]:
-            response_messages.append({"role": h["role"], "content": h["content"]})
+    response_message = f"""User Question: {message}
 
-        response_messages.append({
-            "role": "user",
-            "content": f"""User Question: {message}
+Query Plan: {_to_json(query_plan)}
 
-Query Plan: {json.dumps(query_plan, indent=2)}
+Data Retrieved: {_to_json(_terse(data_summary))}
 
-Data Retrieved: {json.dumps(data_summary, indent=2, default=str)}
+Please provide a concise, insight-driven answer based on this data."""
 
-Please provide a concise, insight-driven answer based on this data.""",
-        })
+    return {
+        "system": response_system,
+        "history": trimmed,
+        "message": response_message,
+        "cache_key": (message, data_fp, terms, context),
+        "query_plan": query_plan,
+    }
 
-        answer = _call_groq(response_system, response_messages, max_tokens=2048)
-        action_trace.append("Response generated successfully")
 
-        return {
-            "answer": answer,
-            "action_trace": action_trace,
-            "data_quality_report": combined_quality_report,
-        }
+def _finish_response(prepared: dict, answer: str, action_trace: list[str], combined_quality_report: dict) -> dict:
+    """Record the generated answer in the answer cache and build the response."""
+    action_trace.append("Response generated successfully")
 
-    except json.JSONDecodeError as e:
+    message, data_fp, terms, context = prepared["cache_key"]
+    answer_cache.store(message, data_fp, terms, {
+        "query_plan": prepared["query_plan"],
+        "answer": answer,
+        "data_quality_report": combined_quality_report,
+    }, context)
+
+    return {
+        "answer": answer,
+        "action_trace": action_trace,
+        "data_quality_report": combined_quality_report,
+    }
+
+
+def _error_response(e: Exception, action_trace: list[str], combined_quality_report: dict) -> dict:
+    """Turn a failure anywhere in the pipeline into a friendly response."""
+    if isinstance(e, orjson.JSONDecodeError):
         logger.error(f"Failed to parse query plan JSON: {e}")
         action_trace.append(f"Error parsing AI query plan: {e}")
         return {
@@ -517,20 +977,88 @@ Please provide a concise, insight-driven answer based on this data.""",
             "action_trace": action_trace,
             "data_quality_report": combined_quality_report,
         }
-    except Exception as e:
-        logger.error(f"Agent error: {e}", exc_info=True)
-        error_str = str(e)
-        # Handle Groq rate limit errors gracefully
-        if "429" in error_str or "rate_limit" in error_str.lower() or "Rate limit" in error_str:
-            action_trace.append("Rate limit reached — waiting for API quota to reset")
-            return {
-                "answer": "Our AI service is temporarily at capacity. This usually resets within a few minutes. Please try again shortly.",
-                "action_trace": action_trace,
-                "data_quality_report": combined_quality_report,
-            }
-        action_trace.append(f"Error: {error_str}")
+
+    logger.error(f"Agent error: {e}", exc_info=True)
+    error_str = str(e)
+    # Handle Groq rate limit errors gracefully
+    if "429" in error_str or "rate_limit" in error_str.lower() or "Rate limit" in error_str:
+        action_trace.append("Rate limit reached — waiting for API quota to reset")
         return {
-            "answer": f"Something went wrong while processing your query. Please try again.",
+            "answer": "Our AI service is temporarily at capacity. This usually resets within a few minutes. Please try again shortly.",
             "action_trace": action_trace,
             "data_quality_report": combined_quality_report,
         }
+    action_trace.append(f"Error: {error_str}")
+    return {
+        "answer": f"Something went wrong while processing your query. Please try again.",
+        "action_trace": action_trace,
+        "data_quality_report": combined_quality_report,
+    }
+
+
+async def process_query(message: str, history: list[dict] = None, refresh: bool = False) -> dict:
+    """
+    Process a user's business intelligence query.
+
+    Args:
+        message: The user's question
+        history: Conversation history list of {"role": str, "content": str}
+        refresh: Bypass the board data cache and refetch from Monday.com
+
+    Returns:
+        {
+            "answer": str,
+            "action_trace": [str, ...],
+            "data_quality_report": dict
+        }
+    """
+    if history is None:
+        history = []
+
+    action_trace = []
+    combined_quality_report = _new_quality_report()
+
+    try:
+        prepared = await _prepare_response(message, history, refresh, action_trace, combined_quality_report)
+        if "result" in prepared:
+            return prepared["result"]
+
+        answer = await _call_groq(prepared["system"], prepared["history"], prepared["message"], max_tokens=2048)
+        return _finish_response(prepared, answer, action_trace, combined_quality_report)
+
+    except Exception as e:
+        return _error_response(e, action_trace, combined_quality_report)
+
+
+async def process_query_stream(message: str, history: list[dict] = None, refresh: bool = False) -> AsyncIterator[tuple[str, object]]:
+    """
+    Streaming variant of process_query.
+    Stage 1 runs to completion first (the JSON plan must be parsed whole),
+    then the Stage-2 answer is yielded as it is generated.
+
+    Yields:
+        ("token", str) for each chunk of answer text, then a single
+        ("done", dict) with the same shape process_query returns.
+    """
+    if history is None:
+        history = []
+
+    action_trace = []
+    combined_quality_report = _new_quality_report()
+
+    try:
+        prepared = await _prepare_response(message, history, refresh, action_trace, combined_quality_report)
+        if "result" in prepared:
+            yield "done", prepared["result"]
+            return
+
+        chunks = []
+        async for text in _call_groq_stream(prepared["system"], prepared["history"], prepared["message"], max_tokens=2048):
+            chunks.append(text)
+            yield "token", text
+
+        answer = "".join(chunks).strip()
+        yield "done", _finish_response(prepared, answer, action_trace, combined_quality_report)
+
+    except Exception as e:
+        yield "done", _error_response(e, action_trace, combined_quality_report)
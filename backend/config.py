@@ -1,21 +1,63 @@
 """
 Configuration module for the Monday.com BI Agent backend.
-Loads environment variables from .env file and exposes them as importable constants.
+Loads environment variables from .env file once into a frozen Config
+and exposes them as importable constants.
 """
 
 import os
+from dataclasses import dataclass
 from dotenv import load_dotenv
 
 # Load environment variables from .env file (for local development)
 load_dotenv()
 
-# Monday.com API Configuration
-MONDAY_API_TOKEN: str = os.getenv("MONDAY_API_TOKEN", "")
-MONDAY_DEALS_BOARD_ID: str = os.getenv("MONDAY_DEALS_BOARD_ID", "")
-MONDAY_WORKORDERS_BOARD_ID: str = os.getenv("MONDAY_WORKORDERS_BOARD_ID", "")
 
-# Groq API Configuration
-GROQ_API_KEY: str = os.getenv("GROQ_API_KEY", "")
+def _seconds(name: str, default: str) -> int:
+    value = os.getenv(name, default)
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a whole number of seconds, got '{value}'")
 
-# Monday.com API Base URL
-MONDAY_API_URL: str = "https://api.monday.com/v2"
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    # Monday.com API Configuration
+    monday_api_token: str
+    monday_deals_board_id: str
+    monday_workorders_board_id: str
+
+    # Groq API Configuration
+    groq_api_key: str
+
+    # How long (seconds) fetched board items are reused across queries
+    cache_ttl_seconds: int
+
+    # How long (seconds) board schemas and groups are reused; they change rarely
+    schema_cache_ttl_seconds: int
+
+    # Monday.com API Base URL
+    monday_api_url: str = "https://api.monday.com/v2"
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Read and validate every setting from the environment."""
+        return cls(
+            monday_api_token=os.getenv("MONDAY_API_TOKEN", ""),
+            monday_deals_board_id=os.getenv("MONDAY_DEALS_BOARD_ID", ""),
+            monday_workorders_board_id=os.getenv("MONDAY_WORKORDERS_BOARD_ID", ""),
+            groq_api_key=os.getenv("GROQ_API_KEY", ""),
+            cache_ttl_seconds=_seconds("CACHE_TTL_SECONDS", "120"),
+            schema_cache_ttl_seconds=_seconds("SCHEMA_CACHE_TTL_SECONDS", "300"),
+        )
+
+
+CONFIG = Config.from_env()
+
+MONDAY_API_TOKEN: str = CONFIG.monday_api_token
+MONDAY_DEALS_BOARD_ID: str = CONFIG.monday_deals_board_id
+MONDAY_WORKORDERS_BOARD_ID: str = CONFIG.monday_workorders_board_id
+GROQ_API_KEY: str = CONFIG.groq_api_key
+MONDAY_API_URL: str = CONFIG.monday_api_url
+CACHE_TTL_SECONDS: int = CONFIG.cache_ttl_seconds
+SCHEMA_CACHE_TTL_SECONDS: int = CONFIG.schema_cache_ttl_seconds
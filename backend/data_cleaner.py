@@ -4,18 +4,46 @@ Handles messy, inconsistent data from Monday.com boards.
 Returns cleaned data alongside a data quality report.
 """
 
+import heapq
 import re
+import sys
 import logging
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from dateutil import parser as date_parser
 
 logger = logging.getLogger(__name__)
 
+# Board columns repeat a small set of distinct values across many rows, so
+# each normalizer remembers its results (typed, so 1 and 1.0 stay distinct);
+# dates only when an explicit format matched, see normalize_date
+NORMALIZER_CACHE_SIZE = 8192
+
 
 # ---------------------------------------------------------------------------
 # Date Normalization
 # ---------------------------------------------------------------------------
 
+_ORDINAL_RE = re.compile(r"(\d+)(st|nd|rd|th)", re.IGNORECASE | re.ASCII)
+
+# Common explicit formats, tried before dateutil (order matters). Each is paired
+# with a literal it cannot match without (" " meaning any whitespace), so a
+# value is only tried against formats of its own shape.
+_DATE_FORMATS = [
+    ("%Y-%m-%d", "-"),    # 2026-02-27
+    ("%d/%m/%Y", "/"),    # 27/02/2026
+    ("%m/%d/%Y", "/"),    # 02/27/2026
+    ("%d-%m-%Y", "-"),    # 27-02-2026
+    ("%m-%d-%Y", "-"),    # 02-27-2026
+    ("%d %b %Y", " "),    # 27 Feb 2026
+    ("%d %B %Y", " "),    # 27 February 2026
+    ("%b %d, %Y", ","),   # Feb 27, 2026
+    ("%B %d, %Y", ","),   # February 27, 2026
+    ("%d/%m/%y", "/"),    # 27/02/26
+    ("%m/%d/%y", "/"),    # 02/27/26
+]
+
+
 def normalize_date(value: str) -> str | None:
     """
     Normalize a date value from various formats to ISO format (YYYY-MM-DD).
@@ -24,46 +52,69 @@ def normalize_date(value: str) -> str | None:
 
     Returns ISO date string or None if unparseable.
     """
-    if not value or not str(value).strip():
+    normalized, cleaned = _normalize_known_date(value)
+    if normalized is not None or cleaned is None:
+        return normalized
+
+    # Fallback to dateutil fuzzy parser. Missing fields are filled from the
+    # current date ("Feb 2026" -> today's day), so the result is not memoized
+    try:
+        parsed = date_parser.parse(cleaned, fuzzy=True, dayfirst=True)
+        return parsed.strftime("%Y-%m-%d")
+    except (ValueError, OverflowError):
+        logger.warning(f"Could not parse date: '{str(value).strip()}'")
         return None
 
-    value = str(value).strip()
 
-    # Already ISO format from Monday.com
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", value):
-        return value
-
-    # Try common explicit formats first (order matters)
-    formats = [
-        "%Y-%m-%d",           # 2026-02-27
-        "%d/%m/%Y",           # 27/02/2026
-        "%m/%d/%Y",           # 02/27/2026
-        "%d-%m-%Y",           # 27-02-2026
-        "%m-%d-%Y",           # 02-27-2026
-        "%d %b %Y",           # 27 Feb 2026
-        "%d %B %Y",           # 27 February 2026
-        "%b %d, %Y",          # Feb 27, 2026
-        "%B %d, %Y",          # February 27, 2026
-        "%d/%m/%y",           # 27/02/26
-        "%m/%d/%y",           # 02/27/26
-    ]
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE, typed=True)
+def _normalize_known_date(value: str) -> tuple[str | None, str | None]:
+    """
+    Parse a date with the explicit formats, which do not depend on today's date.
+    Returns (ISO date, None) on success, (None, None) for empty values, or
+    (None, value without ordinal suffixes) when the fuzzy parser is needed.
+    """
+    if not value or not str(value).strip():
+        return None, None
 
-    # Remove ordinal suffixes (1st, 2nd, 3rd, 4th, etc.)
-    cleaned = re.sub(r"(\d+)(st|nd|rd|th)", r"\1", value, flags=re.IGNORECASE)
+    value = str(value).strip()
 
-    for fmt in formats:
+    # Already ISO format from Monday.com (the common case) — checked without
+    # regex; isdecimal() accepts exactly what \d does
+    if (
+        len(value) == 10 and value[4] == "-" and value[7] == "-"
+        and value[:4].isdecimal() and value[5:7].isdecimal() and value[8:].isdecimal()
+    ):
+        return value, None
+
+    # Remove ordinal suffixes (1st, 2nd, 3rd, 4th, etc.); most values have
+    # none, so only run the regex when a suffix could be present
+    low = value.casefold()
+    if "st" in low or "nd" in low or "rd" in low or "th" in low:
+        cleaned = _ORDINAL_RE.sub(r"\1", value)
+    else:
+        cleaned = value
+
+    # Only try the formats whose separator the value contains, in list order
+    has_space = len(cleaned.split()) > 1
+    for fmt, separator in _DATE_FORMATS:
+        if not (has_space if separator == " " else separator in cleaned):
+            continue
         try:
             parsed = datetime.strptime(cleaned, fmt)
-            return parsed.strftime("%Y-%m-%d")
+            return parsed.strftime("%Y-%m-%d"), None
         except ValueError:
             continue
 
-    # Fallback to dateutil fuzzy parser
+    return None, cleaned
+
+
+def parse_iso_date(value: str | None) -> date | None:
+    """Convert a normalized YYYY-MM-DD string to a date, or None if missing/invalid."""
+    if not value:
+        return None
     try:
-        parsed = date_parser.parse(cleaned, fuzzy=True, dayfirst=True)
-        return parsed.strftime("%Y-%m-%d")
-    except (ValueError, OverflowError):
-        logger.warning(f"Could not parse date: '{value}'")
+        return date.fromisoformat(value)
+    except (ValueError, TypeError):
         return None
 
 
@@ -71,6 +122,34 @@ def normalize_date(value: str) -> str | None:
 # Currency / Number Normalization
 # ---------------------------------------------------------------------------
 
+_PLAIN_NUMBER_CHARS = "0123456789.-"
+# Deletes currency symbols, thousands separators and all Unicode whitespace
+# (the characters \s matches; none are above U+3000)
+_CURRENCY_STRIP_TABLE = {
+    **dict.fromkeys(map(ord, "₹$€£,")),
+    **{cp: None for cp in range(0x3001) if chr(cp).isspace()},
+}
+# Multipliers for the K/M/Cr/L suffixes, keyed by the uppercased suffix
+_SUFFIX_MULTIPLIERS = {
+    "K": 1_000,
+    "M": 1_000_000,
+    "B": 1_000_000_000,
+    "CR": 10_000_000,
+    "CRORE": 10_000_000,
+    "CRORES": 10_000_000,
+    "L": 100_000,
+    "LAKH": 100_000,
+    "LAKHS": 100_000,
+}
+
+
+def _is_decimal_number(text: str) -> bool:
+    """True for an optionally negative decimal without exponent, e.g. "-1.5" or "12."."""
+    integer, _, fraction = text.removeprefix("-").partition(".")
+    return integer.isdecimal() and (not fraction or fraction.isdecimal())
+
+
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE, typed=True)
 def normalize_currency(value: str) -> float | None:
     """
     Normalize currency/number values to float.
@@ -86,31 +165,28 @@ def normalize_currency(value: str) -> float | None:
     if not value:
         return None
 
+    # Plain numbers (the common case) skip the regex work below
+    if not value.strip(_PLAIN_NUMBER_CHARS):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+
     # Remove currency symbols and whitespace
-    cleaned = re.sub(r"[₹$€£,\s]", "", value)
+    cleaned = value.translate(_CURRENCY_STRIP_TABLE)
 
     if not cleaned:
         return None
 
-    # Handle K/M/Cr/L suffixes
+    # Handle K/M/Cr/L suffixes: a trailing run of letters after a plain decimal
     multiplier = 1
-    suffix_match = re.match(r"^(-?\d+\.?\d*)\s*(K|M|B|Cr|L|Lakh|Lakhs|Crore|Crores)$",
-                            cleaned, re.IGNORECASE)
-    if suffix_match:
-        cleaned = suffix_match.group(1)
-        suffix = suffix_match.group(2).upper()
-        multipliers = {
-            "K": 1_000,
-            "M": 1_000_000,
-            "B": 1_000_000_000,
-            "CR": 10_000_000,
-            "CRORE": 10_000_000,
-            "CRORES": 10_000_000,
-            "L": 100_000,
-            "LAKH": 100_000,
-            "LAKHS": 100_000,
-        }
-        multiplier = multipliers.get(suffix, 1)
+    end = len(cleaned)
+    while end and cleaned[end - 1].isalpha():
+        end -= 1
+    if end < len(cleaned):
+        suffix_multiplier = _SUFFIX_MULTIPLIERS.get(cleaned[end:].upper())
+        if suffix_multiplier and _is_decimal_number(cleaned[:end]):
+            cleaned, multiplier = cleaned[:end], suffix_multiplier
 
     try:
         return float(cleaned) * multiplier
@@ -123,6 +199,7 @@ def normalize_currency(value: str) -> float | None:
 # Text Normalization
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE, typed=True)
 def normalize_text(value: str) -> str | None:
     """
     Normalize text values: strip whitespace, standardize casing.
@@ -133,15 +210,13 @@ def normalize_text(value: str) -> str | None:
     if value is None:
         return None
 
-    value = str(value).strip()
+    # Trim and collapse runs of whitespace (split() treats the same characters as \s)
+    value = " ".join(str(value).split())
     if not value:
         return None
 
-    # Collapse multiple spaces
-    value = re.sub(r"\s+", " ", value)
-
     # Title case for general text
-    return value.strip().title()
+    return value.title()
 
 
 # ---------------------------------------------------------------------------
@@ -194,6 +269,11 @@ STATUS_MAPPINGS = {
 }
 
 
+# Mapping keys plus every canonical label keyed by itself
+_STATUS_LOOKUP = {**STATUS_MAPPINGS, **{v: v for v in set(STATUS_MAPPINGS.values())}}
+
+
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE, typed=True)
 def normalize_status(value: str) -> str | None:
     """
     Normalize status values using canonical mappings.
@@ -208,13 +288,18 @@ def normalize_status(value: str) -> str | None:
     if not value:
         return None
 
+    # Already-canonical and lowercase variants hit without lowercasing
+    hit = _STATUS_LOOKUP.get(value)
+    if hit:
+        return hit
+
     # Look up in canonical mapping
-    lookup = value.lower().strip()
+    lookup = value.lower()
     if lookup in STATUS_MAPPINGS:
         return STATUS_MAPPINGS[lookup]
 
     # If not in mapping, return title-cased original
-    return value.strip().title()
+    return value.title()
 
 
 # ---------------------------------------------------------------------------
@@ -222,14 +307,14 @@ def normalize_status(value: str) -> str | None:
 # ---------------------------------------------------------------------------
 
 # Columns known to contain date values
-DATE_COLUMNS = {
+DATE_COLUMNS = frozenset({
     "close date (a)", "tentative close date", "created date",
     "data delivery date", "date of po/loi", "probable start date",
     "probable end date", "last invoice date", "collection date",
-}
+})
 
 # Columns known to contain numeric/currency values
-NUMERIC_COLUMNS = {
+NUMERIC_COLUMNS = frozenset({
     "masked deal value",
     "amount in rupees (excl of gst) (masked)",
     "amount in rupees (incl of gst) (masked)",
@@ -241,10 +326,10 @@ NUMERIC_COLUMNS = {
     "amount receivable (masked)",
     "quantity by ops", "quantity billed (till date)",
     "balance in quantity",
-}
+})
 
 # Columns known to contain status values
-STATUS_COLUMNS = {
+STATUS_COLUMNS = frozenset({
     "deal status", "deal stage", "closure probability",
     "execution status", "billing status", "invoice status",
     "wo status (billed)", "collection status",
@@ -254,29 +339,76 @@ STATUS_COLUMNS = {
     "bd/kam personnel code",
     "is any skylark software platform part of the client deliverables in this deal?",
     "last executed month of recurring project",
-}
+})
 
 # Columns to normalize as general text (sector, names, etc.)
-TEXT_COLUMNS = {
+TEXT_COLUMNS = frozenset({
     "sector/service", "sector",
     "expected billing month", "actual collection month",
+})
+
+
+# Lowercase column title -> kind. Later entries win, so a title listed in
+# several sets keeps the precedence date > number > status > text
+_ALL_KINDS = {
+    **dict.fromkeys(TEXT_COLUMNS, "text"),
+    **dict.fromkeys(STATUS_COLUMNS, "status"),
+    **dict.fromkeys(NUMERIC_COLUMNS, "number"),
+    **dict.fromkeys(DATE_COLUMNS, "date"),
+}
+
+
+@lru_cache(maxsize=1024)
+def _column_kind(col_title: str) -> str:
+    """Classify a column title as "date", "number", "status", "text" or "raw"."""
+    return _ALL_KINDS.get(col_title.lower().strip(), "raw")
+
+
+# Normalizer and quality counter for the categorical column kinds
+_CATEGORICAL_KINDS = {
+    "status": (normalize_status, "normalized_statuses"),
+    "text": (normalize_text, "normalized_text"),
 }
 
+# Issue messages kept in the quality report; the rest are only counted
+MAX_ISSUES = 20
+
+
+def _keep_issue(kept: list, row: int, position: int, kind: str, col_title: str, raw_value) -> None:
+    """
+    Track the first MAX_ISSUES issues in (row, column position) order.
+    kept is a heap keyed on the negated position, so kept[0] is the latest
+    issue kept and the one displaced by an earlier issue.
+    """
+    entry = (-row, -position, kind, col_title, raw_value)
+    if len(kept) < MAX_ISSUES:
+        heapq.heappush(kept, entry)
+    elif entry > kept[0]:
+        heapq.heapreplace(kept, entry)
+
 
 # ---------------------------------------------------------------------------
 # Master cleaning function
 # ---------------------------------------------------------------------------
 
-def clean_board_data(items: list[dict]) -> tuple[list[dict], dict]:
+def clean_board_data(items: list[dict]) -> dict:
     """
     Apply all normalizations across all fields in board data.
+    Works a column at a time: each column's type is classified once and its
+    normalizer mapped over all of its cells.
 
     Args:
         items: Raw list of item dicts from monday_client.get_all_items()
 
-    Returns:
-        (cleaned_items, quality_report) where quality_report summarizes
-        data quality issues found during cleaning.
+    Returns: the cleaned board as one list per field (row i of every list is
+    item i), plus the quality report summarizing issues found during cleaning:
+    {
+        "ids": [...], "names": [...], "groups": [...],
+        "columns": {column_title: [cleaned value or None, ...]},
+        "columns_lc": {column_title: [lowercase str or None, ...]},  # text-valued columns
+        "dates": {column_title: [date or None, ...]},                # date columns
+        "quality": quality_report,
+    }
     """
     quality_report = {
         "total_items": len(items),
@@ -288,66 +420,84 @@ def clean_board_data(items: list[dict]) -> tuple[list[dict], dict]:
         "issues": [],
     }
 
-    cleaned_items = []
+    raw_columns = [item.get("columns", {}) for item in items]
+    row_count = len(items)
 
-    for item in items:
-        cleaned_item = {
-            "id": item.get("id"),
-            "name": item.get("name"),
-            "group": item.get("group", {}),
-            "columns": {},
-        }
+    columns = {}
+    # Lowercase copies of string values, for case-insensitive matching
+    columns_lc = {}
+    # Parsed date values, so filters compare dates instead of strings
+    dates = {}
 
-        for col_title, raw_value in item.get("columns", {}).items():
-            col_key = col_title.lower().strip()
+    # Unformatted issues, bounded to MAX_ISSUES; messages are built at the end
+    issues = []
+    issue_count = 0
 
-            if raw_value is None or (isinstance(raw_value, str) and not raw_value.strip()):
+    titles = list(dict.fromkeys(title for cols in raw_columns for title in cols))
+    for position, col_title in enumerate(titles):
+        kind = _column_kind(col_title)
+        # Rows without the column, or with an empty value, stay None
+        cells = columns[col_title] = [None] * row_count
+
+        rows, values = [], []
+        for row, cols in enumerate(raw_columns):
+            if col_title not in cols:
+                continue
+            raw_value = cols[col_title]
+            if raw_value is None or (isinstance(raw_value, str) and (not raw_value or raw_value.isspace())):
                 quality_report["missing_values"] += 1
-                cleaned_item["columns"][col_title] = None
                 continue
-
-            # Apply appropriate normalization based on column type
-            if col_key in DATE_COLUMNS:
-                normalized = normalize_date(raw_value)
-                if normalized is None and raw_value:
-                    quality_report["unparseable_dates"] += 1
-                    quality_report["issues"].append(
-                        f"Unparseable date in '{col_title}' for item '{item.get('name', 'unknown')}': '{raw_value}'"
-                    )
-                cleaned_item["columns"][col_title] = normalized
-
-            elif col_key in NUMERIC_COLUMNS:
-                normalized = normalize_currency(raw_value)
+            rows.append(row)
+            values.append(raw_value)
+
+        # Apply appropriate normalization based on column type
+        if kind == "date":
+            parsed_dates = dates[col_title] = [None] * row_count
+            for row, raw_value, normalized in zip(rows, values, map(normalize_date, values)):
+                cells[row] = normalized
+                if normalized is None:
+                    if raw_value:
+                        quality_report["unparseable_dates"] += 1
+                        issue_count += 1
+                        _keep_issue(issues, row, position, "date", col_title, raw_value)
+                    continue
+                parsed_dates[row] = parse_iso_date(normalized)
+
+        elif kind == "number":
+            for row, raw_value, normalized in zip(rows, values, map(normalize_currency, values)):
+                cells[row] = normalized
                 if normalized is None and raw_value:
                     quality_report["unparseable_numbers"] += 1
-                    quality_report["issues"].append(
-                        f"Unparseable number in '{col_title}' for item '{item.get('name', 'unknown')}': '{raw_value}'"
-                    )
-                cleaned_item["columns"][col_title] = normalized
-
-            elif col_key in STATUS_COLUMNS:
-                normalized = normalize_status(raw_value)
-                if normalized != raw_value:
-                    quality_report["normalized_statuses"] += 1
-                cleaned_item["columns"][col_title] = normalized
-
-            elif col_key in TEXT_COLUMNS:
-                normalized = normalize_text(raw_value)
+                    issue_count += 1
+                    _keep_issue(issues, row, position, "number", col_title, raw_value)
+
+        elif kind in _CATEGORICAL_KINDS:
+            normalizer, counter = _CATEGORICAL_KINDS[kind]
+            cells_lc = columns_lc[col_title] = [None] * row_count
+            changed = 0
+            for row, raw_value, normalized in zip(rows, values, map(normalizer, values)):
                 if normalized != raw_value:
-                    quality_report["normalized_text"] += 1
-                cleaned_item["columns"][col_title] = normalized
-
-            else:
-                # Keep as-is for unclassified columns
-                cleaned_item["columns"][col_title] = raw_value
-
-        cleaned_items.append(cleaned_item)
-
+                    changed += 1
+                # Categorical values repeat heavily, so share one string object each
+                cells[row] = sys.intern(normalized)
+                cells_lc[row] = sys.intern(normalized.lower())
+            quality_report[counter] += changed
+
+        else:
+            # Keep as-is for unclassified columns
+            cells_lc = columns_lc[col_title] = [None] * row_count
+            for row, raw_value in zip(rows, values):
+                cells[row] = raw_value
+                if isinstance(raw_value, str):
+                    cells_lc[row] = raw_value.lower()
+
+    quality_report["issues"] = [
+        f"Unparseable {kind} in '{col_title}' for item '{items[-neg_row].get('name', 'unknown')}': '{raw_value}'"
+        for neg_row, _, kind, col_title, raw_value in sorted(issues, reverse=True)
+    ]
     # Cap the issues list to avoid huge payloads
-    if len(quality_report["issues"]) > 20:
-        total = len(quality_report["issues"])
-        quality_report["issues"] = quality_report["issues"][:20]
-        quality_report["issues"].append(f"... and {total - 20} more issues")
+    if issue_count > MAX_ISSUES:
+        quality_report["issues"].append(f"... and {issue_count - MAX_ISSUES} more issues")
 
     # Summary line
     total_issues = (
@@ -362,4 +512,12 @@ def clean_board_data(items: list[dict]) -> tuple[list[dict], dict]:
         f"{quality_report['unparseable_numbers']} unparseable numbers."
     )
 
-    return cleaned_items, quality_report
+    return {
+        "ids": [item.get("id") for item in items],
+        "names": [item.get("name") for item in items],
+        "groups": [item.get("group", {}) for item in items],
+        "columns": columns,
+        "columns_lc": columns_lc,
+        "dates": dates,
+        "quality": quality_report,
+    }
@@ -6,12 +6,14 @@ Exposes REST endpoints that the React frontend calls.
 import logging
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from config import MONDAY_DEALS_BOARD_ID, MONDAY_WORKORDERS_BOARD_ID
-from agent import process_query
+from agent import process_query, process_query_stream
 from monday_client import get_board_schema
 
 # Configure logging
@@ -54,6 +56,7 @@ app.add_middleware(
 class QueryRequest(BaseModel):
     message: str
     history: list[dict] = []
+    refresh: bool = False
 
 
 class QueryResponse(BaseModel):
@@ -84,7 +87,7 @@ async def query_endpoint(request: QueryRequest):
     logger.info(f"Processing query: {request.message[:100]}...")
 
     try:
-        result = process_query(request.message, request.history)
+        result = await process_query(request.message, request.history, refresh=request.refresh)
         return QueryResponse(
             answer=result["answer"],
             action_trace=result["action_trace"],
@@ -98,6 +101,29 @@ async def query_endpoint(request: QueryRequest):
         )
 
 
+@app.post("/query/stream")
+async def query_stream_endpoint(request: QueryRequest):
+    """
+    Streaming variant of /query using Server-Sent Events.
+    Emits "token" events with chunks of the answer as it is generated,
+    then one "done" event carrying the full /query response body.
+    """
+    if not request.message.strip():
+        raise HTTPException(status_code=400, detail="Message cannot be empty")
+
+    logger.info(f"Processing streaming query: {request.message[:100]}...")
+
+    async def event_stream():
+        async for event, data in process_query_stream(request.message, request.history, refresh=request.refresh):
+            yield f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -111,9 +137,9 @@ async def health_check():
 
 
 @app.get("/boards/schema")
-async def get_schema(board: str):
+async def get_schema(board: str, refresh: bool = False):
     """
-    Get the live schema for a board.
+    Get the schema for a board (cached briefly; refresh=true refetches).
     Query param 'board' should be "deals" or "workorders".
     """
     board_map = {
@@ -128,7 +154,7 @@ async def get_schema(board: str):
         )
 
     try:
-        schema = get_board_schema(board_map[board])
+        schema = get_board_schema(board_map[board], refresh=refresh)
         return schema
     except Exception as e:
         logger.error(f"Error fetching schema for {board}: {e}")
@@ -1,20 +1,65 @@
 """
 Monday.com API Client
 Makes live REST API calls to Monday.com using GraphQL.
-Every function makes a fresh HTTP request — no caching, no preloading.
+Items are always fetched live; board schemas and groups, which change
+rarely, are reused for SCHEMA_CACHE_TTL_SECONDS unless refresh=True.
+Requests share one keep-alive connection pool, so concurrent fetches
+reuse open TLS connections instead of handshaking each time, and
+transient 502/503/504 responses are retried with backoff.
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+
+import orjson
 import requests
-from config import MONDAY_API_TOKEN, MONDAY_API_URL
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config import MONDAY_API_TOKEN, MONDAY_API_URL, SCHEMA_CACHE_TTL_SECONDS
 
 logger = logging.getLogger(__name__)
 
-HEADERS = {
-    "Authorization": MONDAY_API_TOKEN,
-    "Content-Type": "application/json",
-    "API-Version": "2024-10",
-}
+# Enough pooled connections for the agent's concurrent board fetches
+POOL_SIZE = 8
+
+# (connect, read) seconds: an unreachable API fails fast even with connect
+# retries, while large item pages still get time to arrive
+REQUEST_TIMEOUT = (5, 30)
+
+# Transient gateway errors and failed connects to Monday.com are retried with
+# backoff; every request is a read-only GraphQL query, so retrying the POST is
+# safe. Read timeouts are not retried, so a slow API still fails after one
+# timeout with the "timed out" error below.
+_RETRY = Retry(
+    total=3,
+    read=False,
+    backoff_factor=0.3,
+    status_forcelist=[502, 503, 504],
+    allowed_methods=None,
+    raise_on_status=False,
+)
+
+
+def _new_session() -> requests.Session:
+    """Build the shared HTTP session with Monday.com auth headers, a connection pool and retries."""
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": MONDAY_API_TOKEN,
+        "Content-Type": "application/json",
+        "API-Version": "2024-10",
+        # Item pages are highly compressible JSON; urllib3 decodes both transparently
+        "Accept-Encoding": "gzip, deflate",
+    })
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=_RETRY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_session = _new_session()
 
 
 def _make_request(query: str, variables: dict = None) -> dict:
@@ -27,9 +72,10 @@ def _make_request(query: str, variables: dict = None) -> dict:
         payload["variables"] = variables
 
     try:
-        response = requests.post(MONDAY_API_URL, json=payload, headers=HEADERS, timeout=30)
+        # orjson on both sides: item pages are large nested payloads
+        response = _session.post(MONDAY_API_URL, data=orjson.dumps(payload), timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         if "errors" in data:
             error_msgs = [e.get("message", str(e)) for e in data["errors"]]
@@ -44,21 +90,75 @@ def _make_request(query: str, variables: dict = None) -> dict:
     except requests.exceptions.HTTPError as e:
         logger.error(f"Monday.com API HTTP error: {e}")
         raise Exception(f"Monday.com API HTTP error: {e}")
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         logger.error(f"Monday.com API request failed: {e}")
         raise Exception(f"Monday.com API request failed: {e}")
 
 
-def get_board_schema(board_id: str) -> dict:
+# ---------------------------------------------------------------------------
+# Board metadata cache
+# ---------------------------------------------------------------------------
+
+# {(kind, board_id): (fetched_at, value)}
+_METADATA_CACHE: dict[tuple[str, str], tuple[float, object]] = {}
+# {(kind, board_id): Future} for fetches in progress, which later callers join
+_METADATA_IN_FLIGHT: dict[tuple[str, str], Future] = {}
+_METADATA_LOCK = threading.Lock()
+
+
+def _cached_metadata(kind: str, board_id: str, fetch, refresh: bool):
+    """
+    Return a cached schema/groups result for board_id, refetching after the TTL.
+    Concurrent callers share one fetch per board, refreshes included, so every
+    caller gets the same object.
+    """
+    key = (kind, board_id)
+    with _METADATA_LOCK:
+        entry = _METADATA_CACHE.get(key)
+        if not refresh and entry and time.monotonic() - entry[0] < SCHEMA_CACHE_TTL_SECONDS:
+            return entry[1]
+        pending = _METADATA_IN_FLIGHT.get(key)
+        if pending is None:
+            pending = _METADATA_IN_FLIGHT[key] = Future()
+            owner = True
+        else:
+            owner = False
+
+    if not owner:
+        return pending.result()
+
+    fetched_at = time.monotonic()
+    try:
+        value = fetch(board_id)
+    except Exception as e:
+        with _METADATA_LOCK:
+            del _METADATA_IN_FLIGHT[key]
+        pending.set_exception(e)
+        raise
+
+    with _METADATA_LOCK:
+        _METADATA_CACHE[key] = (fetched_at, value)
+        del _METADATA_IN_FLIGHT[key]
+    pending.set_result(value)
+    return value
+
+
+def get_board_schema(board_id: str, refresh: bool = False) -> dict:
     """
     Fetch the column names and types for a board so the agent
     understands the data structure before querying.
+    Cached for SCHEMA_CACHE_TTL_SECONDS; refresh=True forces a refetch.
 
     Returns: {
         "board_name": str,
         "columns": [{"id": str, "title": str, "type": str}, ...]
     }
     """
+    return _cached_metadata("schema", board_id, _fetch_board_schema, refresh)
+
+
+def _fetch_board_schema(board_id: str) -> dict:
+    """Fetch a board's schema from Monday.com, bypassing the cache."""
     query = """
     query ($boardId: [ID!]!) {
         boards(ids: $boardId) {
@@ -92,10 +192,14 @@ def get_board_schema(board_id: str) -> dict:
     }
 
 
-def get_all_items(board_id: str) -> list[dict]:
+def get_all_items(board_id: str, refresh: bool = False, schema=None) -> list[dict]:
     """
     Fetch all items and their column values from a board.
     Handles pagination for boards with more than 500 items.
+    Column titles come from the board schema: schema is a zero-argument
+    callable returning it, called alongside the first page request, so a
+    caller that needs the schema anyway fetches it only once. Without one,
+    the cached schema is used and refresh=True refetches it.
 
     Returns a list of dicts, each representing one item:
     [
@@ -109,7 +213,6 @@ def get_all_items(board_id: str) -> list[dict]:
     ]
     """
     all_items = []
-    cursor = None
 
     # First page query (uses items_page at the board level)
     first_page_query = """
@@ -126,11 +229,7 @@ def get_all_items(board_id: str) -> list[dict]:
                     }
                     column_values {
                         id
-                        column {
-                            title
-                        }
                         text
-                        value
                     }
                 }
             }
@@ -152,42 +251,55 @@ def get_all_items(board_id: str) -> list[dict]:
                 }
                 column_values {
                     id
-                    column {
-                        title
-                    }
                     text
-                    value
                 }
             }
         }
     }
     """
 
-    # Fetch first page
-    data = _make_request(first_page_query, {"boardId": [board_id]})
-    boards = data.get("boards", [])
+    # One background worker per call fetches the schema and then each next
+    # page while this thread works, so concurrent board fetches never queue
+    # behind each other
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="monday-pages") as background:
+        # Column titles come from the (cached) schema rather than every item page
+        if schema is None:
+            schema = partial(get_board_schema, board_id, refresh=refresh)
+        schema_request = background.submit(schema)
 
-    if not boards:
-        raise Exception(f"Board with ID {board_id} not found")
+        # Fetch first page
+        data = _make_request(first_page_query, {"boardId": [board_id]})
+        boards = data.get("boards", [])
 
-    items_page = boards[0].get("items_page", {})
-    items = items_page.get("items", [])
-    cursor = items_page.get("cursor")
-    all_items.extend(items)
+        if not boards:
+            raise Exception(f"Board with ID {board_id} not found")
 
-    # Fetch subsequent pages
-    while cursor:
-        data = _make_request(next_page_query, {"cursor": cursor})
-        next_page = data.get("next_items_page", {})
-        items = next_page.get("items", [])
-        cursor = next_page.get("cursor")
-        all_items.extend(items)
+        items_page = boards[0].get("items_page", {})
+        items = items_page.get("items", [])
+        cursor = items_page.get("cursor")
+
+        titles = _titles(schema_request.result())
+        if items and any(c.get("id") not in titles for c in items[0].get("column_values", [])):
+            # A column was added since the schema was cached
+            titles = _column_titles(board_id, refresh=True)
+
+        # Fetch subsequent pages; each request goes out as soon as its cursor is
+        # known, and the current page is transformed while it is in flight
+        while True:
+            next_request = background.submit(_make_request, next_page_query, {"cursor": cursor}) if cursor else None
+
+            # Transform items into a cleaner format
+            all_items.extend(_transform_item(item, titles) for item in items)
 
-    # Transform items into a cleaner format
-    return [_transform_item(item) for item in all_items]
+            if next_request is None:
+                return all_items
 
+            next_page = next_request.result().get("next_items_page", {})
+            items = next_page.get("items", [])
+            cursor = next_page.get("cursor")
 
-def get_items_by_column_value(board_id: str, column_id: str, value: str) -> list[dict]:
+
+def get_items_by_column_value(board_id: str, column_id: str, value: str, refresh: bool = False) -> list[dict]:
     """
     Fetch items from a board that match a specific column value.
 
@@ -195,6 +307,7 @@ def get_items_by_column_value(board_id: str, column_id: str, value: str) -> list
         board_id: The board to search in
         column_id: The column ID to filter on
         value: The value to match
+        refresh: Refetch the schema the column titles come from
 
     Returns: same format as get_all_items
     """
@@ -218,11 +331,7 @@ def get_items_by_column_value(board_id: str, column_id: str, value: str) -> list
                 }
                 column_values {
                     id
-                    column {
-                        title
-                    }
                     text
-                    value
                 }
             }
         }
@@ -242,11 +351,7 @@ def get_items_by_column_value(board_id: str, column_id: str, value: str) -> list
                 }
                 column_values {
                     id
-                    column {
-                        title
-                    }
                     text
-                    value
                 }
             }
         }
@@ -271,15 +376,22 @@ def get_items_by_column_value(board_id: str, column_id: str, value: str) -> list
         cursor = next_page.get("cursor")
         all_items.extend(items)
 
-    return [_transform_item(item) for item in all_items]
+    titles = _column_titles(board_id, refresh=refresh)
+    return [_transform_item(item, titles) for item in all_items]
 
 
-def get_board_groups(board_id: str) -> list[dict]:
+def get_board_groups(board_id: str, refresh: bool = False) -> list[dict]:
     """
     Fetch the groups within a board (e.g. pipeline stages or categories).
+    Cached for SCHEMA_CACHE_TTL_SECONDS; refresh=True forces a refetch.
 
     Returns: [{"id": str, "title": str, "color": str}, ...]
     """
+    return _cached_metadata("groups", board_id, _fetch_board_groups, refresh)
+
+
+def _fetch_board_groups(board_id: str) -> list[dict]:
+    """Fetch a board's groups from Monday.com, bypassing the cache."""
     query = """
     query ($boardId: [ID!]!) {
         boards(ids: $boardId) {
@@ -300,16 +412,26 @@ def get_board_groups(board_id: str) -> list[dict]:
     return boards[0].get("groups", [])
 
 
-def _transform_item(item: dict) -> dict:
+def _column_titles(board_id: str, refresh: bool = False) -> dict[str, str]:
+    """Map each column id on a board to its title."""
+    return _titles(get_board_schema(board_id, refresh=refresh))
+
+
+def _titles(schema: dict) -> dict[str, str]:
+    """Map each column id in a board schema to its title."""
+    return {col["id"]: col["title"] for col in schema["columns"]}
+
+
+def _transform_item(item: dict, titles: dict[str, str]) -> dict:
     """
     Transform a raw Monday.com item into a clean dictionary.
-    Maps column titles to their text values for easy consumption.
+    Maps column titles (looked up by column id) to their text values.
     """
     columns = {}
     for col_val in item.get("column_values", []):
-        title = col_val.get("column", {}).get("title", col_val.get("id", "unknown"))
+        col_id = col_val.get("id", "unknown")
         text = col_val.get("text", "")
-        columns[title] = text if text else None
+        columns[titles.get(col_id, col_id)] = text if text else None
 
     group = item.get("group", {})
     return {
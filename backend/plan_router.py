@@ -0,0 +1,94 @@
+"""
+Query Plan Router
+Answers common, unambiguous questions ("total pipeline value", "how many
+open deals", "overdue work orders") with a built-in query plan, so the
+Stage-1 LLM call can be skipped. Patterns match the whole question; anything
+with extra qualifiers (sectors, dates, names) falls through to the LLM.
+"""
+
+import copy
+import re
+
+
+def _plan(boards: list[str], metrics: list[str], analysis_type: str, explanation: str, **filters) -> dict:
+    """Build a plan in the same shape the Stage-1 LLM returns."""
+    return {
+        "boards_to_query": boards,
+        "filters": {
+            "sector": filters.get("sector"),
+            "status": filters.get("status"),
+            "date_range": {"start": None, "end": None},
+        },
+        "metrics": metrics,
+        "analysis_type": analysis_type,
+        "explanation": explanation,
+        "needs_clarification": False,
+    }
+
+
+_PIPELINE_METRICS = ["total_value", "count", "average_value", "pipeline_summary"]
+_OVERDUE_METRICS = ["overdue_check", "count"]
+
+# Optional lead-in words that do not change the question
+_LEAD = r"(?:(?:what is|what's|whats|what are|which are|show me|show|give me|list|any) )?(?:(?:the|our|all) )?"
+
+# (name, pattern, plan) — checked in order, first match wins
+_ROUTES = [
+    (
+        "pipeline_summary",
+        re.compile(_LEAD + r"(?:total |overall |current )?(?:deal |sales )?pipeline(?: value| summary| status| overview)?"),
+        _plan(["deals"], _PIPELINE_METRICS, "summary", "Overall deals pipeline by stage"),
+    ),
+    (
+        "deal_value",
+        re.compile(_LEAD + r"total (?:deal|deals) value"),
+        _plan(["deals"], ["total_value", "count", "average_value"], "summary", "Total value of all deals"),
+    ),
+    (
+        "open_deal_count",
+        re.compile(r"how many open deals(?: are there| do we have)?"),
+        _plan(["deals"], ["count", "total_value"], "summary", "Count of open deals", status="Open"),
+    ),
+    (
+        "deal_count",
+        re.compile(r"how many deals(?: are there| do we have)?"),
+        _plan(["deals"], ["count", "total_value"], "summary", "Count of all deals"),
+    ),
+    (
+        "workorder_count",
+        re.compile(r"how many (?:work ?orders|projects)(?: are there| do we have)?"),
+        _plan(["workorders"], ["count", "total_value"], "summary", "Count of all work orders"),
+    ),
+    (
+        "overdue_deals",
+        re.compile(_LEAD + r"(?:overdue|late|slipping) deals"),
+        _plan(["deals"], _OVERDUE_METRICS, "risk", "Deals past their close date"),
+    ),
+    (
+        "overdue_workorders",
+        re.compile(_LEAD + r"(?:overdue|late|slipping) (?:work ?orders|projects)"),
+        _plan(["workorders"], _OVERDUE_METRICS, "risk", "Work orders past their end date"),
+    ),
+    (
+        "overdue_all",
+        re.compile(_LEAD + r"(?:overdue|late|slipping)(?: items)?"),
+        _plan(["deals", "workorders"], _OVERDUE_METRICS, "risk", "Deals and work orders past their dates"),
+    ),
+]
+
+
+def _normalize(message: str) -> str:
+    """Lowercase, collapse whitespace and drop trailing punctuation."""
+    return " ".join(message.lower().split()).rstrip("?!. ")
+
+
+def route(message: str) -> tuple[str, dict] | None:
+    """
+    Return (route name, query plan) when the whole question matches a built-in
+    route, or None to let the LLM plan it. The plan is a fresh copy.
+    """
+    text = _normalize(message)
+    for name, pattern, plan in _ROUTES:
+        if pattern.fullmatch(text):
+            return name, copy.deepcopy(plan)
+    return None
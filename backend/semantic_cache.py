@@ -0,0 +1,149 @@
+"""
+Semantic Answer Cache
+Reuses the query plan and answer of a previous near-duplicate question,
+skipping both LLM calls when the board data has not changed since.
+Questions are compared as normalized term vectors (cosine similarity);
+entity terms such as sectors, statuses and dates must match exactly.
+"""
+
+import hashlib
+import logging
+import math
+import re
+import threading
+from collections import Counter
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+SIMILARITY_THRESHOLD = 0.95
+MAX_ENTRIES = 256
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Words that carry no meaning for matching BI questions
+_STOPWORDS = frozenset({
+    "a", "an", "the", "is", "are", "was", "were", "be", "our", "my", "we",
+    "us", "me", "i", "you", "what", "whats", "how", "hows", "do", "does",
+    "of", "for", "in", "on", "to", "and", "please", "can", "could", "tell",
+    "show", "give", "list", "with", "looking", "like", "s", "all", "any",
+})
+
+# Terms that change the meaning of an otherwise identical question and so
+# must be present in both questions for a cache hit (e.g. "open" vs "closed")
+_GUARD_TERMS = frozenset({
+    "not", "no", "without", "excluding", "except", "vs", "versus",
+    "this", "last", "next", "previous", "current", "today", "yesterday",
+    "week", "month", "quarter", "year", "q1", "q2", "q3", "q4",
+    "jan", "january", "feb", "february", "mar", "march", "apr", "april",
+    "may", "jun", "june", "jul", "july", "aug", "august", "sep", "sept",
+    "september", "oct", "october", "nov", "november", "dec", "december",
+    "open", "closed", "won", "lost", "overdue", "completed", "pending",
+    "total", "average", "count", "many", "top", "bottom", "highest", "lowest",
+})
+
+
+def _tokenize(text: str) -> list[str]:
+    """Lowercase word tokens with a light plural strip ("deals" -> "deal")."""
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def _embed(tokens: list[str]) -> dict[str, float]:
+    """Unit-length term-frequency vector over the non-stopword tokens."""
+    counts = Counter(t for t in tokens if t not in _STOPWORDS)
+    norm = math.sqrt(sum(c * c for c in counts.values()))
+    if not norm:
+        return {}
+    return {t: c / norm for t, c in counts.items()}
+
+
+def _cosine(a: dict[str, float], b: dict[str, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(w * b.get(t, 0.0) for t, w in a.items())
+
+
+def _guard_terms(tokens: list[str], entity_terms: frozenset[str]) -> frozenset[str]:
+    """Tokens that must match exactly: numbers, dates, negations and board values."""
+    return frozenset(
+        t for t in tokens
+        if t in _GUARD_TERMS or t in entity_terms or any(ch.isdigit() for ch in t)
+    )
+
+
+def entity_terms(available_values: dict[str, list[str]]) -> frozenset[str]:
+    """Tokenize board column values (sectors, statuses, ...) into entity terms."""
+    terms = set()
+    for values in available_values.values():
+        for value in values:
+            terms.update(_tokenize(value))
+    return frozenset(terms - _STOPWORDS)
+
+
+def fingerprint(*parts) -> str:
+    """Stable hash of the board data a cached answer was computed from."""
+    payload = orjson.dumps(parts, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return hashlib.sha1(payload).hexdigest()
+
+
+class SemanticCache:
+    """In-process store of (embedding, guard terms, fingerprint, context, result) tuples."""
+
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD, max_entries: int = MAX_ENTRIES):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: list[tuple[dict[str, float], frozenset[str], str, str, dict]] = []
+        self._lock = threading.Lock()
+
+    def lookup(self, message: str, data_fingerprint: str, terms: frozenset[str], context: str = "") -> dict | None:
+        """
+        Return the cached result for the most similar question, or None.
+        context identifies the conversation so far and the day; only entries
+        stored with the same context (e.g. the date plus a hash of the recent
+        history) can match.
+        """
+        tokens = _tokenize(message)
+        vector = _embed(tokens)
+        if not vector:
+            return None
+        guard = _guard_terms(tokens, terms)
+
+        best, best_score = None, self.threshold
+        with self._lock:
+            for cached_vector, cached_guard, cached_fp, cached_context, result in self._entries:
+                if cached_fp != data_fingerprint or cached_context != context or cached_guard != guard:
+                    continue
+                score = _cosine(vector, cached_vector)
+                if score >= best_score:
+                    best, best_score = result, score
+
+        if best is not None:
+            logger.info(f"Semantic cache hit (similarity {best_score:.3f}) for: {message[:100]}")
+        return best
+
+    def store(self, message: str, data_fingerprint: str, terms: frozenset[str], result: dict, context: str = "") -> None:
+        """Remember the result of a fully answered question."""
+        tokens = _tokenize(message)
+        vector = _embed(tokens)
+        if not vector:
+            return
+        entry = (vector, _guard_terms(tokens, terms), data_fingerprint, context, result)
+        with self._lock:
+            # Entries computed from older board data can never hit again
+            self._entries = [e for e in self._entries if e[2] == data_fingerprint]
+            self._entries.append(entry)
+            if len(self._entries) > self.max_entries:
+                del self._entries[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+answer_cache = SemanticCache()
@@ -3,7 +3,7 @@ import ChatWindow from "./components/ChatWindow";
 import InputBar from "./components/InputBar";
 import ActionTrace from "./components/ActionTrace";
 import DataQualityReport from "./components/DataQualityReport";
-import { sendQuery } from "./api/monday";
+import { streamQuery } from "./api/monday";
 
 /* Logo component */
 function Logo() {
@@ -47,7 +47,13 @@ function App() {
         content: m.content,
       }));
 
-      const response = await sendQuery(message, history);
+      // Render the answer progressively as tokens arrive
+      let streamed = "";
+      const response = await streamQuery(message, history, (token) => {
+        streamed += token;
+        setLoading(false);
+        setMessages([...updatedMessages, { role: "assistant", content: streamed }]);
+      });
       const elapsed = ((Date.now() - startTime) / 1000).toFixed(1);
 
       const assistantMessage = {
@@ -17,3 +17,59 @@ export async function sendQuery(message, history) {
     });
     return response.data;
 }
+
+/**
+ * Send a user query and stream the agent's answer as it is generated.
+ * Reads the Server-Sent Events emitted by POST /query/stream.
+ * @param {string} message - The user's question
+ * @param {Array} history - Conversation history array
+ * @param {Function} onToken - Called with each chunk of answer text
+ * @returns {Promise<Object>} - { answer, action_trace, data_quality_report }
+ */
+export async function streamQuery(message, history, onToken) {
+    const response = await fetch(`${API_BASE_URL}/query/stream`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ message, history }),
+    });
+
+    if (!response.ok || !response.body) {
+        const body = await response.json().catch(() => ({}));
+        const error = new Error(body.detail || `Request failed with status ${response.status}`);
+        error.response = { data: body };
+        throw error;
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+    let result = null;
+
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        // Events are separated by a blank line
+        let boundary;
+        while ((boundary = buffer.indexOf("\n\n")) !== -1) {
+            const rawEvent = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+
+            let event = "message";
+            let data = "";
+            for (const line of rawEvent.split("\n")) {
+                if (line.startsWith("event: ")) event = line.slice(7);
+                else if (line.startsWith("data: ")) data += line.slice(6);
+            }
+
+            if (event === "token") onToken(JSON.parse(data));
+            else if (event === "done") result = JSON.parse(data);
+        }
+    }
+
+    if (!result) {
+        throw new Error("Stream ended before the response completed");
+    }
+    return result;
+}